@@ -6,8 +6,18 @@ Minimal entry point that imports and runs the main application.
 """
 
 import argparse
+import functools
+import re
 import sys
-from src.app import App
+
+# PyInstaller multiprocessing arguments: known prefixes or known substrings
+_PYI_RE = re.compile(
+    r'^(?:--multiprocessing-fork|-OO|-B|-S|-I)'
+    r'|multiprocessing\.resource_tracker|tracker_fd=|pipe_handle='
+)
+
+# Python flags whose following argument (the command) is skipped as well
+_SKIP_NEXT_FLAGS = frozenset({'-c'})
 
 
 def is_pyinstaller_bundle() -> bool:
@@ -17,27 +27,24 @@ def is_pyinstaller_bundle() -> bool:
 
 def filter_pyinstaller_args(args: list) -> list:
     """Filter out PyInstaller-specific arguments."""
+    # Fast path: plain development runs carry nothing to filter
+    if not any(arg in _SKIP_NEXT_FLAGS or _PYI_RE.search(arg) for arg in args):
+        return args
+
     filtered_args = []
     skip_next = False
     
-    for i, arg in enumerate(args):
+    for arg in args:
         if skip_next:
             skip_next = False
             continue
             
         # Skip PyInstaller multiprocessing arguments
-        if (arg.startswith('--multiprocessing-fork') or 
-            arg.startswith('-OO') or 
-            arg.startswith('-B') or 
-            arg.startswith('-S') or 
-            arg.startswith('-I') or
-            'multiprocessing.resource_tracker' in arg or
-            'tracker_fd=' in arg or
-            'pipe_handle=' in arg):
+        if _PYI_RE.search(arg):
             continue
             
         # Skip Python flags that PyInstaller might pass
-        if arg in ['-c']:
+        if arg in _SKIP_NEXT_FLAGS:
             skip_next = True  # Skip the next argument too (the command)
             continue
             
@@ -48,6 +55,18 @@ def filter_pyinstaller_args(args: list) -> list:
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
+    # If running in PyInstaller bundle, filter out PyInstaller-specific arguments
+    if is_pyinstaller_bundle():
+        # In PyInstaller, just use defaults (native mode)
+        return argparse.Namespace(browser=False)
+
+    # Snapshot argv as a tuple so repeated calls hit the parse cache
+    return _parse_argv(tuple(sys.argv[1:]))
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_argv(argv: tuple[str, ...]) -> argparse.Namespace:
+    """Build the argument parser and parse the given argv snapshot (cached)."""
     parser = argparse.ArgumentParser(
         description="2.4GHz Sensor Visualization Application",
         prog="sensor-app",
@@ -75,20 +94,19 @@ WiFi and Bluetooth signals in real-time interactive plots.
         version="2.4GHz Sensor Visualization v1.0.0"
     )
     
-    # If running in PyInstaller bundle, filter out PyInstaller-specific arguments
-    if is_pyinstaller_bundle():
-        # In PyInstaller, just use defaults (native mode)
-        return argparse.Namespace(browser=False)
-    else:
-        # Filter command line arguments to remove PyInstaller artifacts
-        filtered_argv = filter_pyinstaller_args(sys.argv[1:])
-        return parser.parse_args(filtered_argv)
+    # Filter command line arguments to remove PyInstaller artifacts
+    filtered_argv = filter_pyinstaller_args(list(argv))
+    return parser.parse_args(filtered_argv)
 
 
 def main() -> None:
     """Application entry point."""
     args = parse_arguments()
-    
+
+    # Import the app only after argument parsing so --help/--version
+    # do not pay the NiceGUI/FastAPI import cost
+    from src.app import App
+
     # Create and run the application with specified mode
     app = App(browser_mode=args.browser)
     app.run()
@@ -1,27 +1,94 @@
 #!/usr/bin/env python3
 """Enhanced build script for creating standalone executable."""
 
+import importlib.util
 import os
 import platform
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
-import nicegui
+# Host platform name, resolved once at import
+_SYSTEM = platform.system()
+
+# Static PyInstaller arguments; build_executable() adds the NiceGUI data path,
+# platform-specific arguments and the UPX setting
+_BASE_PYINSTALLER_ARGS: tuple[str, ...] = (
+    "python", "-m", "PyInstaller",
+    "main.py",
+    "--name", "NiceGUI-Desktop-App",
+    "--onedir",  # Directory mode for better compatibility
+    "--noarchive",  # Keep .pyc files loose instead of in a compressed PYZ
+    "--windowed",  # No console window
+    "--noconfirm",  # Overwrite without confirmation
+    # No --clean: reuse PyInstaller's analysis cache in build/ on rebuilds;
+    # run scripts/clean.py first to force a from-scratch build
+    "--optimize", "1",  # Strip asserts only; keep docstrings FastAPI reads
+
+    # Collect all uvicorn submodules (loops, protocols, lifespan) it picks at runtime
+    "--collect-submodules", "uvicorn",
+
+    # Exclude development/test packages to reduce size
+    "--exclude-module", "pytest",
+    "--exclude-module", "black",
+    "--exclude-module", "ruff",
+    "--exclude-module", "mypy",
+    "--exclude-module", "coverage",
+    "--exclude-module", "selenium",
+    "--exclude-module", "setuptools",
+    "--exclude-module", "pip",
+    "--exclude-module", "wheel",
+    "--exclude-module", "distutils",
+    "--exclude-module", "unittest",
+    "--exclude-module", "test",
+    "--exclude-module", "pydoc",
+    "--exclude-module", "doctest",
+    "--exclude-module", "tkinter",
+    "--exclude-module", "tkinter.ttk",
+    "--exclude-module", "tkinter.tix",
+    "--exclude-module", "turtle",
+    "--exclude-module", "pdb",
+
+    # Exclude heavy optional packages and test suites never used at runtime
+    "--exclude-module", "matplotlib",
+    "--exclude-module", "IPython",
+    "--exclude-module", "notebook",
+    "--exclude-module", "numpy.tests",
+    "--exclude-module", "pandas.tests",
+    "--exclude-module", "scipy.tests",
+    "--exclude-module", "PIL.tests",
+    "--exclude-module", "sqlalchemy.testing",
+
+    # Performance optimizations
+    "--upx-exclude", "vcruntime140.dll",  # Exclude problematic files from UPX
+)
+
+
+def get_nicegui_dir() -> str:
+    """Locate the installed NiceGUI package directory without importing it."""
+    spec = importlib.util.find_spec("nicegui")
+    if spec is None or not spec.submodule_search_locations:
+        print("NiceGUI is not installed in this environment")
+        sys.exit(1)
+    return spec.submodule_search_locations[0]
 
 
 def get_platform_specific_args() -> list:
     """Get platform-specific PyInstaller arguments."""
     args = []
 
-    if platform.system() == "Darwin":  # macOS
+    if _SYSTEM == "Darwin":  # macOS
         args.extend([
             "--osx-bundle-identifier", "com.nicegui.desktop.demo",
         ])
-    elif platform.system() == "Windows":
+    elif _SYSTEM == "Windows":
         args.extend([
             "--icon", "resources/icon.ico",  # Windows icon
         ])
+    elif _SYSTEM == "Linux":
+        # Strip debug symbols; not done on macOS, where it breaks code signing
+        args.append("--strip")
 
     return args
 
@@ -31,72 +98,41 @@ def build_executable() -> None:
 
     # Get paths
     project_root = Path(__file__).parent.parent
-    nicegui_dir = os.path.dirname(nicegui.__file__)
+    nicegui_dir = get_nicegui_dir()
 
-    print(f"Building for platform: {platform.system()}")
+    print(f"Building for platform: {_SYSTEM}")
     print(f"Project root: {project_root}")
     print(f"NiceGUI directory: {nicegui_dir}")
 
     cmd = [
-        "python", "-m", "PyInstaller",
-        "main.py",
-        "--name", "NiceGUI-Desktop-App",
-        "--onedir",  # Directory mode for better compatibility
-        "--windowed",  # No console window
-        "--clean",  # Clean build artifacts
-        "--noconfirm",  # Overwrite without confirmation
-        "--optimize", "2",  # Optimize Python bytecode
-
+        *_BASE_PYINSTALLER_ARGS,
         # NiceGUI specific
         "--add-data", f"{nicegui_dir}{os.pathsep}nicegui",
-
-        # Hidden imports for common issues
-        "--hidden-import", "uvicorn.logging",
-        "--hidden-import", "uvicorn.loops",
-        "--hidden-import", "uvicorn.loops.auto",
-        "--hidden-import", "uvicorn.protocols",
-        "--hidden-import", "uvicorn.protocols.http",
-        "--hidden-import", "uvicorn.protocols.http.auto",
-        "--hidden-import", "uvicorn.protocols.websockets",
-        "--hidden-import", "uvicorn.protocols.websockets.auto",
-        "--hidden-import", "uvicorn.lifespan",
-        "--hidden-import", "uvicorn.lifespan.on",
-
-        # Exclude development/test packages to reduce size
-        "--exclude-module", "pytest",
-        "--exclude-module", "black",
-        "--exclude-module", "ruff",
-        "--exclude-module", "mypy",
-        "--exclude-module", "coverage",
-        "--exclude-module", "selenium",
-        "--exclude-module", "setuptools",
-        "--exclude-module", "pip",
-        "--exclude-module", "wheel",
-        "--exclude-module", "distutils",
-        "--exclude-module", "unittest",
-        "--exclude-module", "test",
-        "--exclude-module", "pydoc",
-        "--exclude-module", "doctest",
-        "--exclude-module", "tkinter",
-        "--exclude-module", "tkinter.ttk",
-        "--exclude-module", "tkinter.tix",
-        "--exclude-module", "turtle",
-        "--exclude-module", "pdb",
-
-        # Performance optimizations
-        "--strip",  # Strip debug symbols
-        "--upx-exclude", "vcruntime140.dll",  # Exclude problematic files from UPX
-        "--noupx",  # Disable UPX compression for now (can cause issues)
     ]
 
     # Add platform-specific arguments
     cmd.extend(get_platform_specific_args())
 
+    # UPX compression is opt-in: much smaller binaries, slightly slower startup
+    env = None
+    if os.environ.get("PLTAPP_UPX") == "1":
+        upx_path = shutil.which("upx")
+        if upx_path is None:
+            print("PLTAPP_UPX=1 is set but upx was not found on PATH")
+            sys.exit(1)
+        cmd.extend(["--upx-dir", os.path.dirname(upx_path)])
+        # UPX reads default options from the UPX environment variable
+        env = dict(os.environ, UPX="--lzma")
+    else:
+        cmd.append("--noupx")
+
     print("Building executable...")
     print(f"Command: {' '.join(cmd)}")
 
     try:
-        result = subprocess.run(cmd, cwd=project_root, check=True, capture_output=True, text=True)
+        result = subprocess.run(
+            cmd, cwd=project_root, env=env, check=True, capture_output=True, text=True
+        )
         print("Build completed successfully!")
 
         # Check what was created
@@ -106,7 +142,7 @@ def build_executable() -> None:
             for item in dist_dir.iterdir():
                 print(f"  - {item.name}")
 
-        if platform.system() == "Darwin":
+        if _SYSTEM == "Darwin":
             app_bundle = dist_dir / "NiceGUI-Desktop-App.app"
             if app_bundle.exists():
                 print(f"\n✅ macOS app bundle created: {app_bundle}")
@@ -3,51 +3,72 @@
 
 import os
 import shutil
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+# Build artifacts in the project root, matched by exact name or suffix
+ARTIFACT_NAMES = frozenset({"build", "dist"})
+ARTIFACT_SUFFIXES = (".egg-info", ".spec")
+
+# Cache sweep: directories removed whole, files removed by name, and trees
+# that are never descended into. Python 3 writes .pyc/.pyo files only inside
+# __pycache__, so removing those directories covers all bytecode.
+CACHE_DIRS = frozenset({"__pycache__", ".pytest_cache", "htmlcov"})
+CACHE_FILES = frozenset({".coverage"})
+SKIP_DIRS = frozenset({"venv", ".venv", ".git", "node_modules"})
+# Skipped only at the project root, where clean_build_artifacts removes them
+ROOT_SKIP_DIRS = SKIP_DIRS | ARTIFACT_NAMES
+
+
+def _remove_entry(entry: os.DirEntry) -> None:
+    """Remove a file or directory tree and report it."""
+    if entry.is_dir(follow_symlinks=False):
+        shutil.rmtree(entry.path)
+        print(f"Removed {entry.name}/")
+    else:
+        os.remove(entry.path)
+        print(f"Removed {entry.name}")
 
 
 def clean_build_artifacts() -> None:
     """Remove build artifacts."""
-    artifacts = ["build", "dist", "*.egg-info", "*.spec"]
-    for pattern in artifacts:
-        if "*" in pattern:
-            # Handle glob patterns
-            import glob
-
-            for path in glob.glob(pattern):
-                if os.path.isdir(path):
-                    shutil.rmtree(path)
-                    print(f"Removed {path}/")
-                else:
-                    os.remove(path)
-                    print(f"Removed {path}")
-        else:
-            if os.path.exists(pattern):
-                if os.path.isdir(pattern):
-                    shutil.rmtree(pattern)
-                    print(f"Removed {pattern}/")
-                else:
-                    os.remove(pattern)
-                    print(f"Removed {pattern}")
+    # One directory read matches every artifact by name; DirEntry carries the
+    # file type, so no per-pattern glob or exists/isdir calls are needed
+    with os.scandir(".") as entries:
+        artifacts = [
+            entry for entry in entries
+            if entry.name in ARTIFACT_NAMES or entry.name.endswith(ARTIFACT_SUFFIXES)
+        ]
+
+    # Remove the independent trees concurrently; rmtree time is mostly unlink I/O
+    with ThreadPoolExecutor(max_workers=max(1, len(artifacts))) as executor:
+        list(executor.map(_remove_entry, artifacts))
+
+
+def _iter_cache_entries(path: str) -> Iterator[os.DirEntry]:
+    """Yield cache directories and files below path, pruning skipped trees."""
+    skip_dirs = ROOT_SKIP_DIRS if path == "." else SKIP_DIRS
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in CACHE_DIRS:
+                    yield entry
+                elif entry.name not in skip_dirs:
+                    yield from _iter_cache_entries(entry.path)
+            elif entry.name in CACHE_FILES:
+                yield entry
 
 
 def clean_cache_files() -> None:
     """Remove Python cache files."""
-    cache_patterns = ["__pycache__", "*.pyc", "*.pyo", ".pytest_cache", ".coverage", "htmlcov"]
-
-    for root, dirs, files in os.walk("."):
-        # Remove cache directories
-        for cache_dir in cache_patterns:
-            if cache_dir in dirs:
-                cache_path = os.path.join(root, cache_dir)
-                shutil.rmtree(cache_path)
-                print(f"Removed {cache_path}/")
-
-        # Remove cache files
-        for file in files:
-            if file.endswith((".pyc", ".pyo")) or file == ".coverage":
-                file_path = os.path.join(root, file)
-                os.remove(file_path)
-                print(f"Removed {file_path}")
+    # Collect first so nothing is deleted while its parent is being scanned
+    for entry in list(_iter_cache_entries(".")):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+            print(f"Removed {entry.path}/")
+        else:
+            os.remove(entry.path)
+            print(f"Removed {entry.path}")
 
 
 def main() -> None:
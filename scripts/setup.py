@@ -6,26 +6,46 @@ Automates the creation of virtual environment and installation of dependencies
 for the NiceGUI desktop application project.
 """
 
+import contextlib
+import errno
 import os
+import shutil
 import subprocess
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
+# Lock file guarding venv creation and dependency install against concurrent runs
+VENV_LOCK_PATH = Path(".venv-setup.lock")
 
-def run_command(command: list[str], description: str) -> bool:
+
+def run_command(
+    command: list[str],
+    description: str,
+    capture: bool = False,
+    env: dict[str, str] | None = None,
+) -> bool:
     """
     Run a shell command and return success status.
 
     Args:
         command: Command to run as list of strings
         description: Human-readable description of the command
+        capture: If True, buffer the output and print it afterwards; if False,
+            the command writes straight to this process's stdout/stderr
+        env: Environment for the command; inherits the current one if None
 
     Returns:
         True if command succeeded, False otherwise
     """
     print(f"Running: {description}")
     try:
-        result = subprocess.run(command, check=True, capture_output=True, text=True)
+        if not capture:
+            subprocess.run(command, check=True, env=env)
+            return True
+        result = subprocess.run(
+            command, check=True, capture_output=True, text=True, env=env
+        )
         if result.stdout:
             print(result.stdout)
         return True
@@ -36,6 +56,51 @@ def run_command(command: list[str], description: str) -> bool:
         return False
 
 
+@contextlib.contextmanager
+def venv_lock(lock_path: Path = VENV_LOCK_PATH) -> Iterator[None]:
+    """
+    Hold an exclusive file lock while the virtual environment is modified.
+
+    Concurrent runs of this script in one workspace (e.g. parallel CI jobs)
+    otherwise race on venv creation and on pip's unpack step. On Windows,
+    msvcrt.locking gives up after about 10 seconds, so the lock is requested
+    again while another process holds it; a long install there is waited
+    out, and any other locking error is raised.
+
+    Args:
+        lock_path: Path of the lock file to create and lock
+    """
+    with open(lock_path, "a+b") as lock_file:
+        lock_file.seek(0)
+        if sys.platform == "win32":
+            import msvcrt
+
+            waiting = False
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError as e:
+                    # Only contention is retried; other failures would loop forever
+                    if e.errno not in (errno.EDEADLOCK, errno.EACCES):
+                        raise
+                    if not waiting:
+                        print("Waiting for another setup run to release the lock...")
+                        waiting = True
+        else:  # Unix-like (macOS, Linux)
+            import fcntl
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            lock_file.seek(0)
+            if sys.platform == "win32":
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
 def setup_virtual_environment() -> bool:
     """Create and activate virtual environment."""
     venv_path = Path("venv")
@@ -59,8 +124,10 @@ def install_dependencies() -> bool:
     # Determine the correct pip path for the virtual environment
     if os.name == "nt":  # Windows
         pip_path = Path("venv/Scripts/pip")
+        python_path = Path("venv/Scripts/python")
     else:  # Unix-like (macOS, Linux)
         pip_path = Path("venv/bin/pip")
+        python_path = Path("venv/bin/python")
 
     if not pip_path.exists():
         print(f"Error: pip not found at {pip_path}")
@@ -72,11 +139,24 @@ def install_dependencies() -> bool:
         print(f"Error: Requirements file not found at {requirements_file}")
         return False
 
+    # Prefer uv when available: it resolves and installs in parallel from a
+    # shared cache; otherwise fall back to the venv's pip
+    uv_path = shutil.which("uv")
+    if uv_path:
+        command = [
+            uv_path, "pip", "install",
+            "--python", str(python_path),
+            "-r", str(requirements_file),
+        ]
+    else:
+        # --prefer-binary: take a wheel over building a newer sdist
+        command = [
+            str(pip_path), "install", "--prefer-binary",
+            "-r", str(requirements_file),
+        ]
+
     print("Installing dependencies...")
-    if not run_command(
-        [str(pip_path), "install", "-r", str(requirements_file)],
-        "Install development dependencies",
-    ):
+    if not run_command(command, "Install development dependencies"):
         return False
 
     print("Dependencies installed successfully")
@@ -109,13 +189,26 @@ def verify_installation() -> bool:
         "pytest",
     ]
 
+    # Import all packages in a single interpreter instead of one per package;
+    # the first failing import is reported on stderr via sys.exit
+    verify_script = (
+        "import importlib, sys\n"
+        f"for name in {test_imports!r}:\n"
+        "    try:\n"
+        "        importlib.import_module(name)\n"
+        "    except Exception as exc:\n"
+        "        sys.exit(f'Package {name} may not be installed correctly: {exc}')\n"
+    )
+
     print("Verifying package installations...")
-    for package in test_imports:
-        if not run_command(
-            [str(python_path), "-c", f"import {package}"], f"Test import {package}"
-        ):
-            print(f"Warning: Package {package} may not be installed correctly")
-            return False
+    if not run_command(
+        [str(python_path), "-c", verify_script],
+        "Test import of key packages",
+        capture=True,
+        # Don't write .pyc files into site-packages just for an import check
+        env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"),
+    ):
+        return False
 
     print("All packages verified successfully")
     return True
@@ -128,13 +221,14 @@ def main() -> None:
 
     success = True
 
-    # Step 1: Create virtual environment
-    if not setup_virtual_environment():
-        success = False
+    with venv_lock():
+        # Step 1: Create virtual environment
+        if not setup_virtual_environment():
+            success = False
 
-    # Step 2: Install dependencies
-    if success and not install_dependencies():
-        success = False
+        # Step 2: Install dependencies
+        if success and not install_dependencies():
+            success = False
 
     # Step 3: Verify installation
     if success and not verify_installation():
@@ -7,11 +7,18 @@ in a native window, ready for PyInstaller packaging.
 """
 
 import datetime
+import importlib.util
 import socket
+import time
 
 from nicegui import app, ui
 
-from .root_page import setup_root_page
+from .root_page import log_action, on_sensor_shutdown, setup_root_page
+
+# Window and server settings shared by the browser and native run modes
+APP_TITLE = "2.4GHz Sensor Visualization"
+WINDOW_SIZE = (1400, 900)
+BROWSER_PORT = 8080
 
 
 class App:
@@ -49,6 +56,24 @@ class App:
             f"No free port found in range {start_port}-{start_port + max_attempts}"
         )
 
+    def find_ephemeral_port(self) -> int:
+        """Ask the kernel for a free port on the loopback interface.
+
+        Binding to port 0 lets the OS allocate an unused port in a single
+        call, instead of probing candidate ports one by one.
+
+        Returns:
+            Available port number
+
+        Raises:
+            OSError: If the kernel cannot allocate a port
+        """
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            port: int = sock.getsockname()[1]
+        print(f"Found free port: {port}")
+        return port
+
     def is_port_free(self, port: int) -> bool:
         """Check if a port is free.
 
@@ -58,36 +83,41 @@ class App:
         Returns:
             True if port is free, False otherwise
         """
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                # Don't set SO_REUSEADDR to get accurate port availability
-                sock.settimeout(1)  # Quick timeout for testing
-                result = sock.connect_ex(("127.0.0.1", port))
-                if result == 0:
-                    # Port is in use (connection succeeded)
-                    return False
-                else:
-                    # Port appears free, try to bind to be sure
-                    try:
-                        with socket.socket(
-                            socket.AF_INET, socket.SOCK_STREAM
-                        ) as test_sock:
-                            test_sock.bind(("127.0.0.1", port))
-                            return True
-                    except OSError:
-                        return False
-        except Exception:
-            return False
-
-
-
-    def log_action(self, action: str, details: str = "") -> None:
-        """Log UI actions to console with timestamp."""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_message = f"[{timestamp}] UI Action: {action}"
-        if details:
-            log_message += f" - {details}"
-        print(log_message)
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            # Don't set SO_REUSEADDR to get accurate port availability
+            if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
+                # Windows: also refuse ports bound by others with SO_REUSEADDR
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+            try:
+                sock.bind(("127.0.0.1", port))
+            except OSError:
+                return False
+            return True
+
+    def is_native_backend_available(self) -> bool:
+        """Check if the native window backend (pywebview) can be imported.
+
+        Uses a spec lookup so the backend is not actually imported here;
+        NiceGUI imports it later only if native mode is used.
+
+        Returns:
+            True if pywebview is installed, False otherwise
+        """
+        return importlib.util.find_spec("webview") is not None
+
+
+
+    def log_action(
+        self, action: str, details: str = "", now: datetime.datetime | None = None
+    ) -> None:
+        """Log UI actions to console with timestamp.
+
+        Args:
+            action: Short name of the action
+            details: Optional extra information
+            now: Timestamp to use; reuse one the caller already took, if any
+        """
+        log_action(action, details, now=now)
 
 
 
@@ -103,61 +133,70 @@ class App:
         @app.on_shutdown
         def shutdown() -> None:
             """Handle application shutdown event."""
-            self.log_action("Application Shutdown", "Cleanup completed")
-            print(f"Application shutdown: {datetime.datetime.now()}")
+            on_sensor_shutdown()
+            now = datetime.datetime.now()
+            self.log_action("Application Shutdown", "Cleanup completed", now=now)
+            print(f"Application shutdown: {now}")
 
     def run(self) -> None:
         """Run the application with comprehensive error handling."""
+        # Monotonic reference for the startup timing checkpoints below
+        start_time = time.perf_counter()
         try:
-            mode_text = "browser" if self.browser_mode else "native desktop"
-            print(f"Application starting in {mode_text} mode: {datetime.datetime.now()}")
-            self.log_action("Application Startup", f"NiceGUI app initialized in {mode_text} mode")
+            if not self.browser_mode and not self.is_native_backend_available():
+                print("pywebview not available, falling back to browser mode")
+                self.log_action("Native Fallback", "pywebview not installed")
+                self.browser_mode = True
 
-            # Configure UI parameters based on mode
+            mode_text = "browser" if self.browser_mode else "native desktop"
+            now = datetime.datetime.now()
+            print(f"Application starting in {mode_text} mode: {now}")
+            self.log_action(
+                "Application Startup", f"NiceGUI app initialized in {mode_text} mode", now=now
+            )
+
+            # Parameters shared by both modes; each mode adds its own below
+            ui_params = {"reload": False, "title": APP_TITLE}
             if self.browser_mode:
                 # Browser mode: open in default browser
-                ui_params = {
-                    "native": False,
-                    "reload": False,
-                    "show": True,  # Automatically open browser
-                    "title": "2.4GHz Sensor Visualization",
-                    "port": 8080,  # Standard port for browser mode
-                }
-                print("Starting in browser mode on http://localhost:8080")
-                self.log_action("Server Start", "NiceGUI server starting in browser mode on port 8080")
+                ui_params.update(
+                    native=False,
+                    show=True,  # Automatically open browser
+                    port=BROWSER_PORT,  # Standard port for browser mode
+                )
+                print(f"Starting in browser mode on http://localhost:{BROWSER_PORT}")
+                self.log_action("Server Start", f"NiceGUI server starting in browser mode on port {BROWSER_PORT}")
             else:
-                # Native desktop mode: find free port and create native window
+                # Native desktop mode: let the kernel pick a free port
                 try:
-                    free_port = self.find_free_port(start_port=8000)
+                    free_port = self.find_ephemeral_port()
                     print(f"Starting NiceGUI server on port {free_port}")
                     self.log_action(
                         "Server Start", f"NiceGUI server starting on port {free_port}"
                     )
-                    ui_params = {
-                        "native": True,
-                        "reload": False,
-                        "show": False,
-                        "port": free_port,
-                        "title": "2.4GHz Sensor Visualization",
-                        "window_size": (1400, 900),
-                        "fullscreen": False
-                    }
-                except RuntimeError as e:
-                    print(f"Error finding free port: {e}")
-                    print("Falling back to automatic port selection (port=0)")
-                    self.log_action("Port Fallback", "Using automatic port selection")
-                    # Fallback to letting the system choose a port
-                    ui_params = {
-                        "native": True,
-                        "reload": False,
-                        "show": False,
-                        "port": 0,
-                        "title": "2.4GHz Sensor Visualization",
-                        "window_size": (1400, 900),
-                        "fullscreen": False
-                    }
-            
+                except OSError as e:
+                    print(f"Error getting a port from the kernel: {e}")
+                    print("Falling back to scanning for a free port")
+                    self.log_action("Port Fallback", "Scanning ports from 8000")
+                    # Raises RuntimeError if the whole range is taken
+                    free_port = self.find_free_port(start_port=8000)
+                ui_params.update(
+                    native=True,
+                    show=False,
+                    port=free_port,
+                    window_size=WINDOW_SIZE,
+                    fullscreen=False,
+                )
+                self.log_action(
+                    "Startup Timing",
+                    f"Port discovery: {(time.perf_counter() - start_time) * 1000:.1f} ms",
+                )
+
             # Run the application with determined parameters
+            self.log_action(
+                "Startup Timing",
+                f"Server launch: {(time.perf_counter() - start_time) * 1000:.1f} ms",
+            )
             ui.run(**ui_params)
         except KeyboardInterrupt:
             print("\nReceived interrupt signal. Shutting down gracefully...")
@@ -171,12 +210,3 @@ class App:
             print("Application shutdown complete.")
             self.log_action("Application Cleanup", "Application terminated")
 
-
-def main() -> None:
-    """Application entry point."""
-    app_instance = App()
-    app_instance.run()
-
-
-if __name__ == "__main__":
-    main()
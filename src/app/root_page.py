@@ -4,6 +4,8 @@ Root page components and event handlers for the sensor visualization application
 """
 
 import datetime
+import logging
+import time
 from typing import TYPE_CHECKING, Any, Optional
 
 from nicegui import app, ui
@@ -13,14 +15,15 @@ from ..data_generator import generate_sensor_data
 from ..plotting import (
     create_frequency_bandwidth_plot,
     create_scanner_plot,
-    update_frequency_bandwidth_plot,
-    update_scanner_plot,
     PlotDataBuffer
 )
 
 if TYPE_CHECKING:
     from .app import App
 
+# Per-tick diagnostics go through logging so they are skipped unless enabled
+logger = logging.getLogger(__name__)
+
 # Module-level variables for the root page
 dark_mode_enabled = False
 dark_mode_element: ui.dark_mode | None = None
@@ -37,6 +40,30 @@ scanner_plot_element: Optional[ui.plotly] = None
 status_label: Optional[ui.label] = None
 packets_slider: Optional[ui.slider] = None
 
+# Theme names indexed by the dark mode flag
+_THEME_NAMES = ("light", "dark")
+
+# Style strings shared by the About and Config dialogs
+_DIALOG_HEADER_STYLE = "width: 100%; align-items: center; margin-bottom: 20px"
+_DIALOG_TITLE_STYLE = "font-size: 20px; font-weight: bold"
+_SECTION_COLUMN_STYLE = "gap: 8px; margin-bottom: 20px"
+_SECTION_TITLE_STYLE = "font-weight: bold; margin-bottom: 5px"
+_SEPARATOR_STYLE = "margin: 20px 0"
+_CLOSE_BUTTON_PROPS = "flat round"
+_CLOSE_BUTTON_STYLE = "margin: -8px"
+
+# Style strings shared by the two plot cards
+_PLOT_CARD_STYLE = "flex: 1; min-width: 500px"
+_PLOT_TITLE_CLASSES = "text-h6 text-weight-bold q-pa-md"
+_PLOT_STYLE = "height: 400px; width: 100%"
+
+# Color classes the status label switches between
+_STATUS_COLOR_CLASSES = "text-positive text-grey"
+
+# Last formatted log timestamp and its epoch second, reused within a second
+_log_ts_second: int = 0
+_log_ts_text: str = ""
+
 # Selection state storage for both plots
 freq_bw_selection_state = None
 freq_bw_selected_points = None
@@ -61,30 +88,30 @@ def setup_root_page(app: "App") -> None:
         with ui.dialog().props("persistent") as about_dialog:
             with ui.card().style("min-width: 400px; padding: 20px; text-align: center"):
                 # Header
-                with ui.row().style("width: 100%; align-items: center; margin-bottom: 20px"):
-                    ui.label("ℹ️ About").style("font-size: 20px; font-weight: bold")
+                with ui.row().style(_DIALOG_HEADER_STYLE):
+                    ui.label("ℹ️ About").style(_DIALOG_TITLE_STYLE)
                     ui.space()
-                    ui.button(icon="close", on_click=about_dialog.close).props("flat round").style("margin: -8px")
+                    ui.button(icon="close", on_click=about_dialog.close).props(_CLOSE_BUTTON_PROPS).style(_CLOSE_BUTTON_STYLE)
 
                 # App info
                 ui.label("2.4GHz Sensor Visualization").style("font-size: 24px; font-weight: bold; margin-bottom: 10px")
                 ui.label("Version 1.0.0").style("font-size: 16px; color: #666; margin-bottom: 20px")
 
-                ui.separator().style("margin: 20px 0")
+                ui.separator().style(_SEPARATOR_STYLE)
 
                 # Technical details
-                with ui.column().style("gap: 8px; margin-bottom: 20px"):
-                    ui.label("🔧 Built with:").style("font-weight: bold; margin-bottom: 5px")
+                with ui.column().style(_SECTION_COLUMN_STYLE):
+                    ui.label("🔧 Built with:").style(_SECTION_TITLE_STYLE)
                     ui.label("• NiceGUI - Modern Python UI framework")
                     ui.label("• Plotly - Interactive plotting library")
                     ui.label("• PyInstaller - Python to executable packaging")
                     ui.label("• NumPy - Numerical computing")
 
-                ui.separator().style("margin: 20px 0")
+                ui.separator().style(_SEPARATOR_STYLE)
 
                 # Features
-                with ui.column().style("gap: 8px; margin-bottom: 20px"):
-                    ui.label("✨ Features:").style("font-weight: bold; margin-bottom: 5px")
+                with ui.column().style(_SECTION_COLUMN_STYLE):
+                    ui.label("✨ Features:").style(_SECTION_TITLE_STYLE)
                     ui.label("• Real-time 2.4GHz band visualization")
                     ui.label("• WiFi and Bluetooth signal simulation")
                     ui.label("• Frequency vs Bandwidth analysis")
@@ -98,10 +125,10 @@ def setup_root_page(app: "App") -> None:
         with ui.dialog().props("persistent") as config_dialog:
             with ui.card().style("min-width: 400px; padding: 20px"):
                 # Header
-                with ui.row().style("width: 100%; align-items: center; margin-bottom: 20px"):
-                    ui.label("⚙️ Configuration").style("font-size: 20px; font-weight: bold")
+                with ui.row().style(_DIALOG_HEADER_STYLE):
+                    ui.label("⚙️ Configuration").style(_DIALOG_TITLE_STYLE)
                     ui.space()
-                    ui.button(icon="close", on_click=config_dialog.close).props("flat round").style("margin: -8px")
+                    ui.button(icon="close", on_click=config_dialog.close).props(_CLOSE_BUTTON_PROPS).style(_CLOSE_BUTTON_STYLE)
 
                 # Theme setting
                 with ui.row().style("align-items: center; margin-bottom: 20px; gap: 10px"):
@@ -121,16 +148,14 @@ def setup_root_page(app: "App") -> None:
 
                 theme_switch.on("update:model-value", on_theme_change)
 
-                ui.separator().style("margin: 20px 0")
+                ui.separator().style(_SEPARATOR_STYLE)
 
                 # Action buttons
                 with ui.row().style("justify-content: flex-end; gap: 10px; width: 100%"):
 
                     def reset_settings() -> None:
-                        global dark_mode_enabled
-                        dark_mode_enabled = False
                         theme_switch.value = False
-                        toggle_theme()
+                        _apply_theme(False)
                         log_action("Settings Reset", "Reset to default theme")
 
                     ui.button("Reset to Default", on_click=reset_settings).props("color=orange")
@@ -195,7 +220,11 @@ def _setup_control_panel() -> None:
             
             def on_packets_change(value: float) -> None:
                 global packets_per_second
-                packets_per_second = int(value)
+                new_rate = int(value)
+                # The slider fires on every drag step; skip repeats of the same rate
+                if new_rate == packets_per_second:
+                    return
+                packets_per_second = new_rate
                 packets_value_label.text = str(packets_per_second)
                 log_action("Packets Changed", f"New rate: {packets_per_second} packets/sec")
             
@@ -215,17 +244,17 @@ def _setup_plots_section() -> None:
     
     with ui.row().style("width: 100%; gap: 20px"):
         # Left plot - Frequency vs Bandwidth
-        with ui.card().style("flex: 1; min-width: 500px"):
-            ui.label("Frequency vs. Bandwidth").classes("text-h6 text-weight-bold q-pa-md")
-            freq_bw_plot_element = ui.plotly(initial_freq_bw).style("height: 400px; width: 100%")
+        with ui.card().style(_PLOT_CARD_STYLE):
+            ui.label("Frequency vs. Bandwidth").classes(_PLOT_TITLE_CLASSES)
+            freq_bw_plot_element = ui.plotly(initial_freq_bw).style(_PLOT_STYLE)
             
             # Add selection event handler for frequency vs bandwidth plot
             freq_bw_plot_element.on('plotly_selected', lambda e: handle_freq_bw_selection(e.args))
         
         # Right plot - Scanner
-        with ui.card().style("flex: 1; min-width: 500px"):
-            ui.label("Spectrum Scanner").classes("text-h6 text-weight-bold q-pa-md")
-            scanner_plot_element = ui.plotly(initial_scanner).style("height: 400px; width: 100%")
+        with ui.card().style(_PLOT_CARD_STYLE):
+            ui.label("Spectrum Scanner").classes(_PLOT_TITLE_CLASSES)
+            scanner_plot_element = ui.plotly(initial_scanner).style(_PLOT_STYLE)
             
             # Add selection event handler for scanner plot
             scanner_plot_element.on('plotly_selected', lambda e: handle_scanner_selection(e.args))
@@ -235,15 +264,13 @@ def _setup_plots_section() -> None:
 
 def start_generation() -> None:
     """Start sensor data generation."""
-    global is_generating, timer, status_label
+    global is_generating, timer
     
     if is_generating:
         return
     
     is_generating = True
-    if status_label:
-        status_label.text = "Status: Running"
-        status_label.classes("text-positive")
+    _set_status("Status: Running", "text-positive")
     
     # Start timer for 1Hz updates
     timer = ui.timer(1.0, update_sensor_data)
@@ -252,17 +279,26 @@ def start_generation() -> None:
     log_action("Generation Started", f"Started at {packets_per_second} packets/sec")
 
 
+def _set_status(text: str, color_class: str) -> None:
+    """Update the status label text and color class in one pass.
+
+    The previous color class is removed in the same classes() call, so
+    repeated start/stop cycles don't pile up conflicting text-* classes.
+    """
+    if status_label:
+        status_label.text = text
+        status_label.classes(add=color_class, remove=_STATUS_COLOR_CLASSES)
+
+
 def stop_generation() -> None:
     """Stop sensor data generation."""
-    global is_generating, timer, status_label
+    global is_generating, timer
     
     if not is_generating:
         return
     
     is_generating = False
-    if status_label:
-        status_label.text = "Status: Stopped"
-        status_label.classes("text-grey")
+    _set_status("Status: Stopped", "text-grey")
     
     # Stop timer
     if timer:
@@ -324,7 +360,7 @@ def update_sensor_data() -> None:
     try:
         # Generate new sensor data (replacing previous data, not accumulating)
         new_data = generate_sensor_data(packets_per_second)
-        log_action("Data Generated", f"Generated {len(new_data)} data points at {packets_per_second} packets/sec")
+        logger.debug("Generated %d data points at %d packets/sec", len(new_data), packets_per_second)
         
         # Replace data in buffer (not add to it for real-time replacement)
         data_buffer.clear()
@@ -332,7 +368,7 @@ def update_sensor_data() -> None:
         
         # Get current data from buffer
         current_data = data_buffer.get_data()
-        log_action("Data Buffered", f"Buffer contains {len(current_data)} data points")
+        logger.debug("Buffer contains %d data points", len(current_data))
         
         # Update plots with new data using direct data assignment and preserve selections
         if freq_bw_plot_element and current_data:
@@ -376,7 +412,7 @@ def update_sensor_data() -> None:
             
             freq_bw_plot_element.update()
             
-            log_action("Plot Updated", f"Frequency vs Bandwidth plot data updated directly with {len(current_data)} points")
+            logger.debug("Frequency vs Bandwidth plot data updated directly with %d points", len(current_data))
         elif freq_bw_plot_element and not current_data:
             # Clear plot data
             freq_bw_plot_element.figure.data[0].x = []
@@ -431,7 +467,7 @@ def update_sensor_data() -> None:
             
             scanner_plot_element.update()
             
-            log_action("Plot Updated", f"Scanner plot data updated directly with {len(current_data)} points")
+            logger.debug("Scanner plot data updated directly with %d points", len(current_data))
         elif scanner_plot_element and not current_data:
             # Clear plot data
             scanner_plot_element.figure.data[0].x = []
@@ -448,7 +484,7 @@ def update_sensor_data() -> None:
         # Log sample data for debugging
         if current_data:
             sample = current_data[0]
-            log_action("Sample Data", f"First point: freq={sample[1]:.1f}MHz, bw={sample[2]:.1f}MHz, power={sample[3]:.1f}dBm")
+            logger.debug("First point: freq=%.1fMHz, bw=%.1fMHz, power=%.1fdBm", sample[1], sample[2], sample[3])
             
     except Exception as e:
         log_action("Update Error", f"Error updating sensor data: {e}")
@@ -582,26 +618,56 @@ def on_sensor_shutdown() -> None:
     log_action("Sensor Shutdown", "Sensor timers stopped")
 
 
-def log_action(action: str, details: str = "") -> None:
-    """Log UI actions to console with timestamp."""
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+def log_action(
+    action: str, details: str = "", now: datetime.datetime | None = None
+) -> None:
+    """Log UI actions to console with timestamp.
+
+    Args:
+        action: Short name of the action
+        details: Optional extra information
+        now: Timestamp to use; reuse one the caller already took, if any
+    """
+    if now is not None:
+        timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+    else:
+        timestamp = _log_timestamp()
     log_message = f"[{timestamp}] UI Action: {action}"
     if details:
         log_message += f" - {details}"
     print(log_message)
 
 
+def _log_timestamp() -> str:
+    """Return the current local time for log lines, formatted once per second."""
+    global _log_ts_second, _log_ts_text
+    second = int(time.time())
+    if second != _log_ts_second:
+        _log_ts_second = second
+        _log_ts_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+    return _log_ts_text
+
+
 def toggle_theme() -> None:
     """Toggle between light and dark themes using Quasar dark mode."""
-    global dark_mode_enabled, dark_mode_element
-    dark_mode_enabled = not dark_mode_enabled
-    theme = "dark" if dark_mode_enabled else "light"
+    _apply_theme(not dark_mode_enabled)
+
+
+def _apply_theme(dark: bool) -> None:
+    """Switch to the given theme; applying the current theme again is harmless.
+
+    Args:
+        dark: True for the dark theme, False for the light theme
+    """
+    global dark_mode_enabled
+    dark_mode_enabled = dark
+    theme = _THEME_NAMES[dark]
 
     log_action("Theme Toggle", f"Switched to {theme} mode")
 
     # Apply theme using Quasar dark mode
     if dark_mode_element:
-        dark_mode_element.value = dark_mode_enabled
+        dark_mode_element.value = dark
 
 
 def show_config_dialog() -> None:
@@ -627,12 +693,11 @@ def show_about_dialog() -> None:
 
 
 def quit_application() -> None:
-    """Quit the application gracefully."""
-    global timer
-    # Stop sensor timers before quitting
-    if timer:
-        timer.active = False
-        timer = None
+    """Quit the application gracefully.
+
+    Sensor timers are stopped by the app's shutdown handler, which also
+    runs when the window is closed directly.
+    """
     log_action("Application Quit", "User requested quit from menu")
     app.shutdown()
     
\ No newline at end of file
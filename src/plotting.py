@@ -5,7 +5,7 @@ This module provides functions to create and update scatter plots for
 2.4-2.5GHz band sensor data using Plotly and NiceGUI integration.
 """
 
-from typing import List, Tuple, Optional
+from typing import List, Tuple
 from collections import deque
 import plotly.graph_objects as go
 import plotly.express as px
@@ -274,8 +274,7 @@ def update_frequency_bandwidth_plot(fig: go.Figure, data: List[SensorData]) -> g
         # Clear the plot but maintain structure
         fig.data[0].x = []
         fig.data[0].y = []
-        if hasattr(fig.data[0].marker, 'color'):
-            fig.data[0].marker.color = []
+        fig.data[0].marker.color = []
         return fig
     
     # Extract new data
@@ -306,10 +305,8 @@ def update_scanner_plot(fig: go.Figure, data: List[SensorData]) -> go.Figure:
         # Clear the plot but maintain structure
         fig.data[0].x = []
         fig.data[0].y = []
-        if hasattr(fig.data[0].marker, 'color'):
-            fig.data[0].marker.color = []
-        if hasattr(fig.data[0].marker, 'size'):
-            fig.data[0].marker.size = []
+        fig.data[0].marker.color = []
+        fig.data[0].marker.size = []
         return fig
     
     # Extract new data
@@ -38,6 +38,48 @@ def test_port_checking():
         assert port == 8000
 
 
+@pytest.mark.unit
+def test_port_in_use_detection():
+    """Test that a port held by a listening socket is reported as not free."""
+    import socket
+
+    app = App()
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        port = listener.getsockname()[1]
+
+        assert app.is_port_free(port) is False
+
+
+@pytest.mark.unit
+def test_ephemeral_port():
+    """Test that the kernel-assigned port is a usable free port."""
+    app = App()
+
+    port = app.find_ephemeral_port()
+
+    assert isinstance(port, int)
+    assert 0 < port < 65536
+    assert app.is_port_free(port) is True
+
+
+@pytest.mark.unit
+def test_native_port_fallback_scans_range():
+    """Test that a failed kernel port lookup falls back to the port scan."""
+    app = App()
+
+    with patch.object(app, 'is_native_backend_available', return_value=True), \
+            patch.object(app, 'find_ephemeral_port', side_effect=OSError("no port")), \
+            patch.object(app, 'is_port_free', return_value=True), \
+            patch('src.app.app.ui') as mock_ui:
+        app.run()
+
+    mock_ui.run.assert_called_once()
+    assert mock_ui.run.call_args.kwargs['port'] == 8000
+
+
 @pytest.mark.unit
 def test_port_finding_failure():
     """Test that find_free_port raises error when no ports available."""
@@ -49,6 +91,19 @@ def test_port_finding_failure():
             app.find_free_port(start_port=8000, max_attempts=3)
 
 
+@pytest.mark.unit
+def test_native_backend_probe():
+    """Test that the native backend check uses a spec lookup only."""
+    app = App()
+
+    with patch('src.app.app.importlib.util.find_spec', return_value=None) as mock_find:
+        assert app.is_native_backend_available() is False
+        mock_find.assert_called_once_with("webview")
+
+    with patch('src.app.app.importlib.util.find_spec', return_value=Mock()):
+        assert app.is_native_backend_available() is True
+
+
 @pytest.mark.unit
 def test_log_action():
     """Test that log_action prints correctly formatted messages."""
@@ -68,6 +123,20 @@ def test_log_action():
         assert "[" in call_args  # Should have timestamp
 
 
+@pytest.mark.unit
+def test_log_timestamp_cached_per_second(monkeypatch):
+    """Test that log timestamps are formatted once per wall-clock second."""
+    monkeypatch.setattr(root_page, '_log_ts_second', 0)
+    monkeypatch.setattr(root_page, '_log_ts_text', "")
+
+    with patch('src.app.root_page.time.time', return_value=1_700_000_000.5), \
+            patch('src.app.root_page.time.strftime', return_value="ts") as mock_strftime:
+        assert root_page._log_timestamp() == "ts"
+        assert root_page._log_timestamp() == "ts"
+
+        mock_strftime.assert_called_once()
+
+
 @pytest.mark.unit
 def test_theme_toggle():
     """Test theme toggle functionality."""
@@ -93,6 +162,19 @@ def test_theme_toggle():
         assert root_page.dark_mode is False
 
 
+@pytest.mark.unit
+def test_apply_theme_is_idempotent():
+    """Test that applying a theme sets it rather than toggling it."""
+    dark_mode_element = Mock()
+    with patch.object(root_page, 'dark_mode_element', dark_mode_element), \
+            patch.object(root_page, 'dark_mode_enabled', True):
+        # Resetting to light mode twice must stay in light mode
+        root_page._apply_theme(False)
+        root_page._apply_theme(False)
+        assert root_page.dark_mode_enabled is False
+        assert dark_mode_element.value is False
+
+
 @pytest.mark.unit
 def test_get_public_ip_success():
     """Test successful public IP retrieval."""
@@ -146,6 +228,20 @@ def test_setup_shutdown_handler():
         mock_app.on_shutdown.assert_called_once()
 
 
+@pytest.mark.unit
+def test_shutdown_handler_stops_sensor_timer():
+    """Test that the shutdown handler stops a running sensor timer."""
+    with patch('src.app.app.app') as mock_app:
+        App()
+        shutdown = mock_app.on_shutdown.call_args[0][0]
+
+    timer = Mock()
+    with patch.object(root_page, 'timer', timer):
+        shutdown()
+        assert timer.active is False
+        assert root_page.timer is None
+
+
 @pytest.mark.unit
 def test_modal_dialog_methods_exist():
     """Test that modal dialog methods exist and are callable."""